@@ -1,23 +1,184 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
-from typing import List
+from typing import Annotated, Iterator, List, Optional
 
 import click
-from flask import Flask, jsonify, render_template, request
+import orjson
+from flask import (
+    Flask,
+    abort,
+    has_request_context,
+    jsonify,
+    render_template,
+    request,
+    stream_with_context,
+)
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+)
+from sqlalchemy import (
+    delete,
+    event,
+    exists,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    text,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.pool import QueuePool
+
+
+class OrjsonProvider(JSONProvider):
+    """Serialize JSON with orjson, which encodes datetimes natively in C."""
+
+    options = orjson.OPT_NAIVE_UTC
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self.options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # _prepare_response_obj is private to Flask, but it is what the built-in
+        # providers use to apply jsonify's args/kwargs rules.
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.options), mimetype="application/json"
+        )
+
+
+def _is_sqlite_file(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
 
-app = Flask(__name__)
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///team_management.db"
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
-db = SQLAlchemy(app)
+def _engine_options(uri: str) -> dict:
+    """Connection pool settings suited to the database ``uri`` points at."""
+    url = make_url(uri)
+    if url.get_backend_name() == "sqlite" and not _is_sqlite_file(url):
+        # Flask-SQLAlchemy gives in-memory SQLite a StaticPool, which has a single
+        # shared connection and accepts no sizing options.
+        return {}
+    options = {
+        "poolclass": QueuePool,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
+    if url.get_backend_name() == "sqlite":
+        # Pooled SQLite connections may be handed between worker threads.
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+def _read_only_sqlite_url(uri: str) -> Optional[str]:
+    """Read-only URI for the same SQLite file as ``uri``, or None if not a file DB."""
+    url = make_url(uri)
+    if not _is_sqlite_file(url):
+        return None
+    if not url.query.get("uri"):
+        url = url.set(database=f"file:{url.database}")
+    url = url.update_query_dict({"mode": "ro", "uri": "true"})
+    return url.render_as_string(hide_password=False)
+
+
+class RoutingSession(Session):
+    """Run queries for GET requests on the read-only engine, when there is one."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context() and request.method == "GET":
+            engine = self._db.engines.get("read")
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
 
 
-@app.before_first_request
+app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///team_management.db"
+app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# FLASK_* environment variables override the settings above, for example
+# FLASK_SQLALCHEMY_DATABASE_URI to point the app at another database.
+app.config.from_prefixed_env()
+# Reuse connections across requests, with pool settings that match the
+# configured database.
+app.config.setdefault(
+    "SQLALCHEMY_ENGINE_OPTIONS",
+    _engine_options(app.config["SQLALCHEMY_DATABASE_URI"]),
+)
+# With WAL enabled, readers on their own read-only connections never wait on
+# the writer. Other databases keep serving reads from the main engine.
+_read_url = _read_only_sqlite_url(app.config["SQLALCHEMY_DATABASE_URI"])
+if _read_url is not None:
+    app.config["SQLALCHEMY_BINDS"] = {"read": {"url": _read_url, "pool_size": 8}}
+
+app.config["CACHE_TYPE"] = "SimpleCache"
+app.config["CACHE_DEFAULT_TIMEOUT"] = 60
+
+db = SQLAlchemy(app, session_options={"class_": RoutingSession})
+cache = Cache(app)
+
+SQLITE_PRAGMAS = (
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-64000",
+)
+# WAL lets readers proceed alongside the single writer, and synchronous=NORMAL
+# only fsyncs at checkpoints instead of on every commit. Both need write access,
+# so they are only applied to the writer.
+SQLITE_WRITER_PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL") + SQLITE_PRAGMAS
+
+
+def _sqlite_pragma_listener(pragmas):
+    def apply_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+    return apply_pragmas
+
+
+with app.app_context():
+    for bind_key, pragmas in ((None, SQLITE_WRITER_PRAGMAS), ("read", SQLITE_PRAGMAS)):
+        engine = db.engines.get(bind_key)
+        if engine is not None and engine.dialect.name == "sqlite":
+            event.listen(engine, "connect", _sqlite_pragma_listener(pragmas))
+
+
+_database_initialized = False
+
+
+@app.before_request
 def initialize_database() -> None:
-    """Ensure all database tables exist before handling requests."""
-    db.create_all()
+    """Ensure all database tables exist before handling the first request."""
+    # Flask 2.3 removed before_first_request, so run the setup once by hand.
+    global _database_initialized
+    if not _database_initialized:
+        db.create_all()
+        _database_initialized = True
 
 
 @app.cli.command("init-db")
@@ -27,6 +188,79 @@ def init_db_command() -> None:
     click.echo("Initialized the database.")
 
 
+# Columns added after the initial schema, as (table, column, DDL, backfill SQL).
+SCHEMA_UPGRADES = [
+    ("teams", "member_count", "INTEGER NOT NULL DEFAULT 0", None),
+    (
+        "teams",
+        "updated_at",
+        "DATETIME NOT NULL DEFAULT '1970-01-01 00:00:00.000000'",
+        "UPDATE teams SET updated_at = created_at",
+    ),
+    (
+        "members",
+        "updated_at",
+        "DATETIME NOT NULL DEFAULT '1970-01-01 00:00:00.000000'",
+        "UPDATE members SET updated_at = joined_at",
+    ),
+]
+
+# member_count is derived data, so every upgrade recounts it from scratch.
+RECOUNT_MEMBERS = (
+    "UPDATE teams SET member_count = "
+    "(SELECT COUNT(*) FROM members WHERE members.team_id = teams.id)"
+)
+
+
+def _check_duplicate_member_emails(connection) -> None:
+    """Refuse to build the unique (team_id, email) index over duplicate rows."""
+    duplicates = connection.execute(
+        text(
+            "SELECT team_id, email, GROUP_CONCAT(id, ', ') FROM members "
+            "GROUP BY team_id, email HAVING COUNT(*) > 1 ORDER BY team_id, email"
+        )
+    ).all()
+    if duplicates:
+        lines = [
+            f"  team {team_id}, email {email!r}: member ids {member_ids}"
+            for team_id, email, member_ids in duplicates
+        ]
+        raise click.ClickException(
+            "Members must have unique emails within a team. Update or remove "
+            "these duplicates and re-run upgrade-db:\n" + "\n".join(lines)
+        )
+
+
+@app.cli.command("upgrade-db")
+def upgrade_db_command() -> None:
+    """Add any columns or indexes missing from an existing database."""
+    db.create_all()
+    added = []
+    with db.engine.begin() as connection:
+        # pysqlite only opens a transaction before DML, which would let each
+        # ALTER TABLE commit on its own; begin explicitly so a failure part-way
+        # through leaves the database untouched.
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql("BEGIN")
+        inspector = inspect(connection)
+        for table, column, ddl, backfill in SCHEMA_UPGRADES:
+            existing = {col["name"] for col in inspector.get_columns(table)}
+            if column in existing:
+                continue
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+            if backfill:
+                connection.execute(text(backfill))
+            added.append(f"{table}.{column}")
+        connection.execute(text(RECOUNT_MEMBERS))
+        _check_duplicate_member_emails(connection)
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+    for column in added:
+        click.echo(f"Added {column}.")
+    click.echo("Upgraded the database.")
+
+
 class Team(db.Model):
     __tablename__ = "teams"
 
@@ -34,6 +268,10 @@ class Team(db.Model):
     name = db.Column(db.String(120), unique=True, nullable=False)
     description = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    member_count = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
 
     members = db.relationship(
         "Member",
@@ -46,9 +284,9 @@ class Team(db.Model):
         data = {
             "id": self.id,
             "name": self.name,
-            "description": self.description or "",
-            "created_at": self.created_at.isoformat(),
-            "member_count": len(self.members),
+            "description": self.description if self.description is not None else "",
+            "created_at": self.created_at,
+            "member_count": self.member_count,
         }
         if include_members:
             data["members"] = [member.to_dict() for member in self.members]
@@ -57,12 +295,19 @@ class Team(db.Model):
 
 class Member(db.Model):
     __tablename__ = "members"
+    __table_args__ = (
+        db.Index("uq_members_team_email", "team_id", "email", unique=True),
+        db.Index("ix_members_team_id_name", "team_id", "name"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False)
     email = db.Column(db.String(255), nullable=False)
     role = db.Column(db.String(120), nullable=True)
     joined_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
 
     team_id = db.Column(db.Integer, db.ForeignKey("teams.id"), nullable=False)
 
@@ -71,36 +316,184 @@ class Member(db.Model):
             "id": self.id,
             "name": self.name,
             "email": self.email,
-            "role": self.role or "",
-            "joined_at": self.joined_at.isoformat(),
+            "role": self.role if self.role is not None else "",
+            "joined_at": self.joined_at,
             "team_id": self.team_id,
         }
 
 
+def _touch_team(connection, team_id: int, member_delta: int = 0) -> None:
+    """Bump a team's updated_at (and member_count) after a member change."""
+    teams = Team.__table__
+    connection.execute(
+        teams.update()
+        .where(teams.c.id == team_id)
+        .values(
+            member_count=teams.c.member_count + member_delta,
+            updated_at=datetime.utcnow(),
+        )
+    )
+
+
+@event.listens_for(Member, "after_insert")
+def _member_inserted(mapper, connection, member: Member) -> None:
+    _touch_team(connection, member.team_id, 1)
+
+
+@event.listens_for(Member, "after_update")
+def _member_updated(mapper, connection, member: Member) -> None:
+    _touch_team(connection, member.team_id)
+
+
+@event.listens_for(Member, "after_delete")
+def _member_deleted(mapper, connection, member: Member) -> None:
+    _touch_team(connection, member.team_id, -1)
+
+
+@cache.memoize()
+def _team_json(team_id: int, version: datetime) -> Optional[bytes]:
+    """Serialized team details, cached per ``updated_at`` version of the team."""
+    team = db.session.scalars(
+        select(Team).options(selectinload(Team.members)).where(Team.id == team_id)
+    ).one_or_none()
+    if team is None:
+        # Deleted since get_team read its version; None results are never cached.
+        return None
+    return orjson.dumps(team.to_dict(include_members=True), option=app.json.options)
+
+
+def _duplicate_email_error():
+    return (
+        jsonify({"error": "A member with this email already exists in this team."}),
+        400,
+    )
+
+
+def _team_exists(team_id: int) -> bool:
+    stmt = select(literal(1)).where(Team.id == team_id).limit(1)
+    return db.session.scalar(stmt) is not None
+
+
+def _teams_etag() -> str:
+    count, last_updated = db.session.execute(
+        select(func.count(Team.id), func.max(Team.updated_at))
+    ).one()
+    return hashlib.md5(
+        f"{count}:{last_updated}".encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+RequiredText = Annotated[str, Field(min_length=1)]
+
+
+class Payload(BaseModel):
+    """JSON request body; string fields are stripped and empty values use defaults."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, validate_default=True)
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _empty_as_default(cls, value, info: ValidationInfo):
+        return value or cls.model_fields[info.field_name].get_default(
+            call_default_factory=True
+        )
+
+
+class TeamCreate(Payload):
+    name: RequiredText = ""
+    description: str = ""
+
+
+class TeamUpdate(Payload):
+    # A missing or empty name keeps the current one; a whitespace-only one is
+    # rejected.
+    name: Optional[RequiredText] = None
+    description: str = ""
+
+
+class MemberCreate(Payload):
+    name: RequiredText = ""
+    email: RequiredText = ""
+    role: str = ""
+
+
+class MemberUpdate(Payload):
+    name: Optional[RequiredText] = None
+    email: Optional[RequiredText] = None
+    role: str = ""
+
+
+class BulkMemberCreate(Payload):
+    members: List[MemberCreate] = Field(default_factory=list, min_length=1)
+
+
+# Error messages for invalid payloads, keyed by the offending field. Errors with
+# no field (e.g. a body that is not JSON) fall back to the generic message.
+TEAM_ERRORS = {
+    "name": "Team name is required.",
+    "description": "Team description must be text.",
+}
+MEMBER_ERRORS = {
+    "name": "Both name and email are required.",
+    "email": "Both name and email are required.",
+    "role": "Member role must be text.",
+}
+BULK_MEMBER_ERRORS = {"members": "A list of members is required.", **MEMBER_ERRORS}
+
+
+def _validation_error(error: ValidationError, messages: dict):
+    location = error.errors()[0]["loc"]
+    field = location[-1] if location else None
+    if isinstance(field, int):
+        # The entry itself is not an object, e.g. {"members": [5]}.
+        field = "name"
+    return jsonify({"error": messages.get(field, "Bad request.")}), 400
+
+
 @app.route("/")
 def index():
     return render_template("index.html")
 
 
+def _generate_teams_json() -> Iterator[bytes]:
+    """Yield the team list as JSON one team at a time instead of building it whole."""
+    teams = db.session.scalars(
+        select(Team).order_by(Team.name.asc()).execution_options(yield_per=500)
+    )
+    yield b"["
+    for index, team in enumerate(teams):
+        yield (b"," if index else b"") + orjson.dumps(
+            team.to_dict(), option=app.json.options
+        )
+    yield b"]"
+
+
 @app.route("/api/teams", methods=["GET"])
 def list_teams():
-    teams: List[Team] = Team.query.order_by(Team.name.asc()).all()
-    return jsonify([team.to_dict() for team in teams])
+    etag = _teams_etag()
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(
+            stream_with_context(_generate_teams_json()), mimetype="application/json"
+        )
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
 
 
 @app.route("/api/teams", methods=["POST"])
 def create_team():
-    data = request.get_json() or {}
-    name = (data.get("name") or "").strip()
-    description = (data.get("description") or "").strip()
+    try:
+        payload = TeamCreate.model_validate_json(request.get_data(cache=False))
+    except ValidationError as error:
+        return _validation_error(error, TEAM_ERRORS)
+    name = payload.name
 
-    if not name:
-        return jsonify({"error": "Team name is required."}), 400
-
-    if Team.query.filter_by(name=name).first():
+    if db.session.scalar(select(Team).where(Team.name == name)):
         return jsonify({"error": "A team with this name already exists."}), 400
 
-    team = Team(name=name, description=description)
+    team = Team(name=name, description=payload.description)
     db.session.add(team)
     db.session.commit()
 
@@ -109,27 +502,39 @@ def create_team():
 
 @app.route("/api/teams/<int:team_id>", methods=["GET"])
 def get_team(team_id: int):
-    team = Team.query.get_or_404(team_id)
-    return jsonify(team.to_dict(include_members=True))
+    version = db.session.scalar(select(Team.updated_at).where(Team.id == team_id))
+    body = _team_json(team_id, version) if version is not None else None
+    if body is None:
+        abort(404)
+    return app.response_class(body, mimetype="application/json")
 
 
 @app.route("/api/teams/<int:team_id>", methods=["PUT"])
 def update_team(team_id: int):
-    team = Team.query.get_or_404(team_id)
-    data = request.get_json() or {}
-
-    name = (data.get("name") or team.name).strip()
-    description = (data.get("description") or "").strip()
-
-    if not name:
-        return jsonify({"error": "Team name is required."}), 400
-
-    existing_team = Team.query.filter(Team.id != team_id, Team.name == name).first()
-    if existing_team:
+    try:
+        payload = TeamUpdate.model_validate_json(request.get_data(cache=False))
+        payload_error = None
+    except ValidationError as error:
+        payload, payload_error = None, error
+    name = payload.name if payload is not None else None
+
+    # Load the team and check the new name for conflicts in a single query.
+    other_team = aliased(Team)
+    name_taken = exists().where(other_team.name == name, other_team.id != team_id)
+    row = db.session.execute(
+        select(Team, name_taken.label("name_taken")).where(Team.id == team_id)
+    ).one_or_none()
+    if row is None:
+        abort(404)
+    team, name_taken = row
+
+    if payload_error is not None:
+        return _validation_error(payload_error, TEAM_ERRORS)
+    if name_taken:
         return jsonify({"error": "A team with this name already exists."}), 400
 
-    team.name = name
-    team.description = description
+    team.name = name or team.name
+    team.description = payload.description
     db.session.commit()
 
     return jsonify(team.to_dict(include_members=True))
@@ -137,62 +542,133 @@ def update_team(team_id: int):
 
 @app.route("/api/teams/<int:team_id>", methods=["DELETE"])
 def delete_team(team_id: int):
-    team = Team.query.get_or_404(team_id)
-    db.session.delete(team)
+    # Set-based deletes avoid loading the team and every member just to cascade.
+    db.session.execute(delete(Member).where(Member.team_id == team_id))
+    if not db.session.execute(delete(Team).where(Team.id == team_id)).rowcount:
+        abort(404)
     db.session.commit()
     return jsonify({"status": "deleted"})
 
 
 @app.route("/api/teams/<int:team_id>/members", methods=["POST"])
 def add_member(team_id: int):
-    team = Team.query.get_or_404(team_id)
-    data = request.get_json() or {}
+    if not _team_exists(team_id):
+        abort(404)
+    try:
+        payload = MemberCreate.model_validate_json(request.get_data(cache=False))
+    except ValidationError as error:
+        return _validation_error(error, MEMBER_ERRORS)
+
+    if db.session.scalar(
+        select(Member).where(Member.team_id == team_id, Member.email == payload.email)
+    ):
+        return _duplicate_email_error()
+
+    member = Member(**payload.model_dump(), team_id=team_id)
+    db.session.add(member)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another request added the same email after the check above.
+        db.session.rollback()
+        return _duplicate_email_error()
+
+    return jsonify(member.to_dict()), 201
 
-    name = (data.get("name") or "").strip()
-    email = (data.get("email") or "").strip()
-    role = (data.get("role") or "").strip()
 
-    if not name or not email:
-        return jsonify({"error": "Both name and email are required."}), 400
+@app.route("/api/teams/<int:team_id>/members/bulk", methods=["POST"])
+def add_members_bulk(team_id: int):
+    if not _team_exists(team_id):
+        abort(404)
+    try:
+        payload = BulkMemberCreate.model_validate_json(request.get_data(cache=False))
+    except ValidationError as error:
+        return _validation_error(error, BULK_MEMBER_ERRORS)
 
-    member = Member(name=name, email=email, role=role, team=team)
-    db.session.add(member)
+    rows = [{**entry.model_dump(), "team_id": team_id} for entry in payload.members]
+
+    emails = [row["email"] for row in rows]
+    existing_member = db.session.scalar(
+        select(Member).where(Member.team_id == team_id, Member.email.in_(emails))
+    )
+    if existing_member or len(set(emails)) != len(emails):
+        return _duplicate_email_error()
+
+    # A single multi-row INSERT bypasses the per-row mapper events, so the
+    # team's member_count is adjusted once for the whole batch.
+    try:
+        members = db.session.scalars(insert(Member).returning(Member), rows).all()
+    except IntegrityError:
+        db.session.rollback()
+        return _duplicate_email_error()
+    _touch_team(db.session.connection(), team_id, len(members))
+    created = [member.to_dict() for member in members]
     db.session.commit()
 
-    return jsonify(member.to_dict()), 201
+    return jsonify(created), 201
 
 
 @app.route("/api/teams/<int:team_id>/members", methods=["GET"])
 def list_members(team_id: int):
-    team = Team.query.get_or_404(team_id)
-    members = [member.to_dict() for member in team.members]
-    return jsonify(members)
+    members = db.session.scalars(
+        select(Member).where(Member.team_id == team_id).order_by(Member.name)
+    ).all()
+    # Only an empty result needs a second query to tell "no members" from 404.
+    if not members and not _team_exists(team_id):
+        abort(404)
+    return jsonify([member.to_dict() for member in members])
 
 
 @app.route("/api/members/<int:member_id>", methods=["PUT"])
 def update_member(member_id: int):
-    member = Member.query.get_or_404(member_id)
-    data = request.get_json() or {}
-
-    name = (data.get("name") or member.name).strip()
-    email = (data.get("email") or member.email).strip()
-    role = (data.get("role") or "").strip()
-
-    if not name or not email:
-        return jsonify({"error": "Both name and email are required."}), 400
-
-    member.name = name
-    member.email = email
-    member.role = role
-    db.session.commit()
+    try:
+        payload = MemberUpdate.model_validate_json(request.get_data(cache=False))
+        payload_error = None
+    except ValidationError as error:
+        payload, payload_error = None, error
+    email = payload.email if payload is not None else None
+
+    # Load the member and check the new email for conflicts in a single query;
+    # the subquery correlates on the member's own team_id.
+    other_member = aliased(Member)
+    email_taken = exists().where(
+        other_member.team_id == Member.team_id,
+        other_member.email == email,
+        other_member.id != member_id,
+    )
+    row = db.session.execute(
+        select(Member, email_taken.label("email_taken")).where(Member.id == member_id)
+    ).one_or_none()
+    if row is None:
+        abort(404)
+    member, email_taken = row
+
+    if payload_error is not None:
+        return _validation_error(payload_error, MEMBER_ERRORS)
+    if email_taken:
+        return _duplicate_email_error()
+
+    member.name = payload.name or member.name
+    member.email = email or member.email
+    member.role = payload.role
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return _duplicate_email_error()
 
     return jsonify(member.to_dict())
 
 
 @app.route("/api/members/<int:member_id>", methods=["DELETE"])
 def delete_member(member_id: int):
-    member = Member.query.get_or_404(member_id)
-    db.session.delete(member)
+    team_id = db.session.scalar(
+        delete(Member).where(Member.id == member_id).returning(Member.team_id)
+    )
+    if team_id is None:
+        abort(404)
+    # Statement-level deletes skip the mapper events, so update the team here.
+    _touch_team(db.session.connection(), team_id, -1)
     db.session.commit()
     return jsonify({"status": "deleted"})
 
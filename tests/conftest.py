@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+from sqlalchemy import event
+
+# The app builds its engines at import time, so point it at a scratch database
+# before it is imported.
+_database_dir = tempfile.mkdtemp()
+os.environ["FLASK_SQLALCHEMY_DATABASE_URI"] = (
+    f"sqlite:///{os.path.join(_database_dir, 'test.db')}"
+)
+
+from app import app as flask_app  # noqa: E402
+from app import cache, db  # noqa: E402
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_database_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def app():
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+        cache.clear()
+    yield flask_app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def queries(app):
+    """Records every SQL statement as a (bind, statement) pair."""
+    statements = []
+    with app.app_context():
+        engines = {None: db.engines[None], "read": db.engines["read"]}
+
+    listeners = []
+    for bind_key, engine in engines.items():
+
+        def record(conn, cursor, statement, *args, key=bind_key):
+            statements.append((key, statement))
+
+        event.listen(engine, "before_cursor_execute", record)
+        listeners.append((engine, record))
+
+    yield statements
+
+    for engine, record in listeners:
+        event.remove(engine, "before_cursor_execute", record)